@@ -1,69 +1,269 @@
+import argparse
+import contextlib
+import io
+import json
+import math
+import os
 import simpy
-import random
-import statistics
+import sys
 import time
+from collections import deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+try:
+    from numba import njit
+
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in so the kernels below run as plain Python
+        when Numba is not installed."""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+
+        def wrap(func):
+            return func
+
+        return wrap
+
+
+# Shared random-number source for both engines: a single PCG64 generator is
+# faster per draw than the stdlib Mersenne Twister and supports the batched
+# draws used by the fast engine.  Seeded once so results stay reproducible.
+RANDOM_SEED = 42
+RNG = np.random.default_rng(RANDOM_SEED)
+
+
+# Normalized station configuration: raw config dicts are parsed into this
+# once per setup instead of being re-indexed field by field
+StationConfig = namedtuple(
+    "StationConfig", ["name", "num_servers", "mean_service_time", "queue_capacity"]
+)
+
+
+def _parse_station_configs(station_configs):
+    """Turn a list of raw config dicts into StationConfig tuples."""
+    return [
+        StationConfig(
+            config["name"],
+            config["num_servers"],
+            config["mean_service_time"],
+            config.get("queue_capacity", float("inf")),
+        )
+        for config in station_configs
+    ]
+
+
+def _mask_to_demands(mask):
+    """Decode a 3-bit demand mask into the n/n/n list form used in logs."""
+    return [mask & 1, (mask >> 1) & 1, (mask >> 2) & 1]
+
+
+def _buf_append(buf, n, value):
+    """Write `value` at index `n` of a preallocated sample buffer, doubling
+    its capacity first if full.  Returns the (possibly reallocated) buffer;
+    the caller owns the fill count."""
+    if n == len(buf):
+        buf = np.resize(buf, 2 * n)
+    buf[n] = value
+    return buf
 
 
 class ServiceStation:
+    # Slots instead of a per-instance __dict__: serve() does several
+    # attribute reads per customer and slot descriptors resolve at a
+    # fixed offset instead of a dict lookup
+    __slots__ = (
+        "env",
+        "num_servers",
+        "mean_service_time",
+        "queue_capacity",
+        "collect_stats",
+        "resource",
+        "_queue",
+        "wait_times",
+        "n_waits",
+        "service_times",
+        "n_services",
+        "q_area",
+        "q_last_update",
+        "q_max",
+        "customers_served",
+        "server_customers_served",
+        "next_server",
+        "_svc_buf",
+        "_svc_idx",
+        "has_available_queue",
+        "_cap_int",
+    )
+
+    # Exponential service-time variates are drawn in batches of this size
+    SERVICE_BATCH = 1024
+
     def __init__(
-        self, env, num_servers, mean_service_time, queue_capacity=float("inf")
+        self,
+        env,
+        num_servers,
+        mean_service_time,
+        queue_capacity=float("inf"),
+        collect_stats=True,
     ):
         self.env = env
         self.num_servers = num_servers
         self.mean_service_time = mean_service_time
         self.queue_capacity = queue_capacity
+        # When False, serve() skips all statistics recording (for
+        # throughput/timing runs where only the engine cost matters)
+        self.collect_stats = collect_stats
 
         # Single shared queue feeding c servers (M/M/c model)
         self.resource = simpy.Resource(env, capacity=num_servers)
-
-        self.wait_times = []
-        self.service_times = []
-        self.queue_lengths = []
+        # Direct reference to the resource's wait list: len(self._queue)
+        # skips the resource attribute chain on every capacity check
+        self._queue = self.resource.queue
+
+        # Pre-allocated sample buffers with a write cursor, doubled on
+        # overflow: appends are O(1) array stores and the reductions in
+        # print_results run on the filled prefix without a conversion pass
+        self.wait_times = np.empty(64, dtype=np.float64)
+        self.n_waits = 0
+        self.service_times = np.empty(64, dtype=np.float64)
+        self.n_services = 0
+        # Time-weighted queue-length integral (area under the curve),
+        # advanced just before every enqueue/dequeue point: average queue
+        # length is exact between arrivals, not a PASTA sample mean
+        self.q_area = 0.0
+        self.q_last_update = 0.0
+        self.q_max = 0
         self.customers_served = 0
 
         # Track which server served each customer (for statistics)
         self.server_customers_served = [0 for _ in range(num_servers)]
         self.next_server = 0  # Round-robin assignment for tracking
 
-    def has_available_queue(self):
-        """Check if queue has space available"""
-        # In M/M/c model, check if total queue length is below capacity
-        return len(self.resource.queue) < self.queue_capacity
+        # Pre-drawn service times consumed via a cursor (one vectorized
+        # RNG call per batch instead of one scalar draw per customer),
+        # same pattern as FastStation
+        self._svc_buf = RNG.exponential(mean_service_time, self.SERVICE_BATCH)
+        self._svc_idx = 0
+
+        # Specialize the capacity check once at construction: unlimited
+        # queues get a constant-True check, finite ones compare against a
+        # plain int (no float-vs-inf comparison on every call)
+        if queue_capacity == float("inf"):
+            self.has_available_queue = lambda: True
+        else:
+            self._cap_int = int(queue_capacity)
+            self.has_available_queue = lambda: len(self._queue) < self._cap_int
 
     def get_current_queue_length(self):
         """Get current queue length (customers waiting, not being served)"""
-        return len(self.resource.queue)
+        return len(self._queue)
 
     def get_current_in_service(self):
         """Get number of customers currently being served"""
         return self.resource.count
 
-    def serve(self, customer_id):
-        arrival_time = self.env.now
-
-        # Record queue length when customer arrives
-        queue_length = len(self.resource.queue)
-        self.queue_lengths.append(queue_length)
-
-        # Request service from the shared resource pool
-        with self.resource.request() as request:
-            yield request
+    def next_service_time(self):
+        """Pop the next pre-drawn exponential service time, refilling the
+        batch when exhausted.
 
+        The refill reads the module-level RNG (not a cached reference)
+        because run_workload reseeds it per workload."""
+        if self._svc_idx == len(self._svc_buf):
+            self._svc_buf = RNG.exponential(
+                self.mean_service_time, self.SERVICE_BATCH
+            )
+            self._svc_idx = 0
+        value = self._svc_buf[self._svc_idx]
+        self._svc_idx += 1
+        return value
+
+    def get_wait_stats(self):
+        """Return (average, max) waiting time"""
+        if self.n_waits == 0:
+            return 0, 0
+        waits = self.wait_times[: self.n_waits]
+        return waits.mean(), waits.max()
+
+    def get_avg_service_time(self):
+        """Return average service time"""
+        if self.n_services == 0:
+            return 0
+        return self.service_times[: self.n_services].mean()
+
+    def get_total_service_time(self):
+        """Return total busy time across all servers (for utilization)"""
+        if self.n_services == 0:
+            return 0.0
+        return self.service_times[: self.n_services].sum()
+
+    def _advance_queue_clock(self):
+        """Accumulate queue-length x elapsed-time up to the current time."""
+        now = self.env.now
+        if now > self.q_last_update:
+            self.q_area += len(self._queue) * (now - self.q_last_update)
+            self.q_last_update = now
+
+    def get_queue_stats(self):
+        """Return (time-weighted average, max) queue length"""
+        self._advance_queue_clock()
+        now = self.env.now
+        if now == 0:
+            return 0, 0
+        return self.q_area / now, self.q_max
+
+    def serve(self):
+        env = self.env
+        resource = self.resource
+        collect_stats = self.collect_stats
+        arrival_time = env.now
+
+        if collect_stats:
+            # Advance the queue integral before the queue may grow
+            self._advance_queue_clock()
+
+        # Request service from the shared resource pool.  A bare
+        # request/release pair skips the Request context manager's
+        # __enter__/__exit__ machinery on the per-customer hot path.
+        request = resource.request()
+        if collect_stats:
+            queue_length = len(self._queue)
+            if queue_length > self.q_max:
+                self.q_max = queue_length
+        yield request
+
+        if collect_stats:
             # Customer got a server
-            wait_time = self.env.now - arrival_time
-            self.wait_times.append(wait_time)
+            self.wait_times = _buf_append(
+                self.wait_times, self.n_waits, env.now - arrival_time
+            )
+            self.n_waits += 1
 
-            # Assign to server (round-robin for tracking purposes)
-            server_index = self.next_server
-            self.next_server = (self.next_server + 1) % self.num_servers
+        # Assign to server (round-robin for tracking purposes)
+        server_index = self.next_server
+        self.next_server = (self.next_server + 1) % self.num_servers
 
-            service_time = random.expovariate(1.0 / self.mean_service_time)
-            self.service_times.append(service_time)
+        service_time = self.next_service_time()
+        if collect_stats:
+            self.service_times = _buf_append(
+                self.service_times, self.n_services, service_time
+            )
+            self.n_services += 1
 
-            yield self.env.timeout(service_time)
+        yield env.timeout(service_time)
 
-            self.customers_served += 1
-            self.server_customers_served[server_index] += 1
+        self.customers_served += 1
+        self.server_customers_served[server_index] += 1
+        if collect_stats:
+            # Advance the integral before release hands the freed server
+            # to the queue head (that dequeue happens at this timestamp)
+            self._advance_queue_clock()
+        resource.release(request)
 
 
 class BuffetSimulation:
@@ -74,12 +274,17 @@ class BuffetSimulation:
         self.total_customers = 0
         self.completed_customers = 0
         self.requeue_count = 0
-        self.customer_total_times = []
-        self.waiting_area = []  # Queue for customers waiting to enter stations
+        # Time in system is only reported as avg/max/min: running
+        # accumulators instead of a per-customer list
+        self.tt_n = 0
+        self.tt_sum = 0.0
+        self.tt_min = math.inf
+        self.tt_max = 0.0
         self.unmet_demand_returns = 0  # Count customers returning due to unmet demands
-        self.customers_completed_dining = (
-            set()
-        )  # Track unique customers who finished dining
+        # Unique customers who finished dining: a first-visit flag per base
+        # id plus a counter (replaces a growing set of id strings)
+        self.unique_diners = 0
+        self._already_dined = bytearray()
         self.customers_left_full_queue = (
             0  # Customers who left because waiting queue was full
         )
@@ -94,6 +299,34 @@ class BuffetSimulation:
         )
         self.event_log = []  # Log of all customer events
         self.station_snapshots = []  # Snapshots of station conditions at each minute
+        # Customers blocked on the dining-capacity gate / full dining queue,
+        # woken one-at-a-time when a service completion frees a slot
+        self.capacity_waiters = deque()
+        self.dining_queue_waiters = deque()
+
+    def _record_total_time(self, time_in_system):
+        """Fold one completed customer's time in system into the stats."""
+        self.tt_n += 1
+        self.tt_sum += time_in_system
+        if time_in_system < self.tt_min:
+            self.tt_min = time_in_system
+        if time_in_system > self.tt_max:
+            self.tt_max = time_in_system
+
+    def _wake_one(self, waiters):
+        """Wake the first customer blocked on a capacity condition."""
+        if waiters:
+            waiters.popleft().succeed()
+
+    def _mark_dined(self, base_id):
+        """Count a customer the first time their base id completes dining."""
+        if base_id >= len(self._already_dined):
+            self._already_dined.extend(
+                b"\x00" * (base_id + 1 - len(self._already_dined))
+            )
+        if not self._already_dined[base_id]:
+            self._already_dined[base_id] = 1
+            self.unique_diners += 1
 
     def log_event(self, event_type, customer_id, station_name="", details=""):
         """Log a customer event with timestamp"""
@@ -112,268 +345,290 @@ class BuffetSimulation:
         snapshot = {"time": self.env.now}
         for name, station in self.stations.items():
             snapshot[name] = {
-                "queue_length": len(station.resource.queue),
-                "in_service": station.resource.count,
+                "queue_length": station.get_current_queue_length(),
+                "in_service": station.get_current_in_service(),
                 "total_served": station.customers_served,
             }
         self.station_snapshots.append(snapshot)
 
-    def setup_stations(self, station_configs):
-        for config in station_configs:
-            queue_capacity = config.get("queue_capacity", float("inf"))
-            station = ServiceStation(
+    def setup_stations(self, station_configs, collect_stats=True):
+        # Construction and the info printout are split so benchmark or
+        # sweep harnesses can call _build_stations alone
+        self._build_stations(_parse_station_configs(station_configs), collect_stats)
+        self._print_station_info()
+
+    def _build_stations(self, configs, collect_stats):
+        for config in configs:
+            self.stations[config.name] = ServiceStation(
                 self.env,
-                config["num_servers"],
-                config["mean_service_time"],
-                queue_capacity,
+                config.num_servers,
+                config.mean_service_time,
+                config.queue_capacity,
+                collect_stats,
+            )
+
+        # Cache direct station references so the hot customer loop skips
+        # the name-keyed dict lookups
+        self._waiting = self.stations["waiting"]
+        self._dining = self.stations["dining"]
+        self._food_stations = [
+            (name, self.stations[name])
+            for name in ("appetizer", "main_course", "dessert")
+        ]
+
+        # Dining total capacity (queue + servers) is constant after setup;
+        # cache it so every capacity poll skips the inf check
+        if self._dining.queue_capacity == float("inf"):
+            self._dining_total_cap = float("inf")
+        else:
+            self._dining_total_cap = (
+                int(self._dining.queue_capacity) + self._dining.num_servers
             )
-            self.stations[config["name"]] = station
-            if queue_capacity != float("inf"):
-                capacity_str = f"total queue capacity = {queue_capacity}, total capacity = {queue_capacity}"
+
+    def _print_station_info(self):
+        for name, station in self.stations.items():
+            if station.queue_capacity != float("inf"):
+                capacity_str = f"total queue capacity = {station.queue_capacity}, total capacity = {station.queue_capacity}"
             else:
                 capacity_str = "unlimited queue"
             print(
-                f"Station '{config['name']}': {config['num_servers']} servers, "
-                f"service time = {config['mean_service_time']:.2f} min, {capacity_str}"
+                f"Station '{name}': {station.num_servers} servers, "
+                f"service time = {station.mean_service_time:.2f} min, {capacity_str}"
             )
         print()
 
-    def get_total_waiting_queue_length(self):
-        """Get total number of customers in waiting station queue"""
-        return len(self.stations["waiting"].resource.queue)
-
-    def get_total_service_station_customers(self):
-        """Get total customers in appetizer, main_course, and dessert stations"""
-        total = 0
-        for station_name in ["appetizer", "main_course", "dessert"]:
-            # Count customers in queue + being served
-            station = self.stations[station_name]
-            total += len(station.resource.queue) + station.resource.count
-        return total
-
     def get_dining_total_capacity(self):
         """Get total capacity of dining station (queue + servers)"""
-        station = self.stations["dining"]
-        # Total capacity = customers in queue + customers being served
-        # In M/M/c: max queue size + number of servers
-        if station.queue_capacity == float("inf"):
-            return float("inf")
-        return station.queue_capacity + station.num_servers
+        # Constant after setup_stations: max queue size + number of servers
+        # (or inf), cached there instead of being recomputed per poll
+        return self._dining_total_cap
 
     def generate_service_requirement(self):
-        """Generate service requirement in n/n/n format for appetizer/main_course/dessert"""
-        while True:
-            req = [
-                random.choice([0, 1]),  # Appetizer
-                random.choice([0, 1]),  # Main course
-                random.choice([0, 1]),  # Dessert
-            ]
-            # Ensure at least one station is required (not 0/0/0)
-            if sum(req) > 0:
-                return req
-
-    def generate_arrivals(self, mean_arrival_time, requeue_prob):
-        while True:
-            yield self.env.timeout(random.expovariate(1.0 / mean_arrival_time))
+        """Generate service requirement as a 3-bit appetizer/main_course/dessert mask"""
+        # Masks 1..7 are exactly the non-zero combinations, so one draw
+        # replaces the three random.choice calls plus the 0/0/0 reroll
+        return int(RNG.integers(1, 8))
+
+    def generate_arrivals(self, mean_arrival_time, requeue_prob, until_time):
+        # Draw the whole Poisson arrival schedule upfront in bulk cumsum'd
+        # NumPy batches (the fast engine's _pregenerate approach) instead
+        # of one scalar exponential per arrival
+        n_est = max(64, int(1.5 * until_time / mean_arrival_time))
+        arrival_times = np.cumsum(RNG.exponential(mean_arrival_time, n_est))
+        while arrival_times[-1] < until_time:
+            extra = np.cumsum(RNG.exponential(mean_arrival_time, n_est))
+            arrival_times = np.concatenate([arrival_times, arrival_times[-1] + extra])
+
+        env = self.env
+        for arrival_time in arrival_times:
+            if arrival_time >= until_time:
+                break
+            yield env.timeout(arrival_time - env.now)
 
             self.customer_count += 1
             self.total_customers += 1
-            customer_id = f"Customer_{self.customer_count}"
+            # Customers are tracked by plain int id; the "Customer_<n>"
+            # label is only built where an event is actually logged
+            customer_id = self.customer_count
             service_req = self.generate_service_requirement()
 
             # Check if waiting station has space
-            waiting_capacity = (
-                self.stations["waiting"].num_servers
-                * self.stations["waiting"].queue_capacity
-            )
-            current_waiting = (
-                self.get_total_waiting_queue_length()
-                + self.stations["waiting"].customers_served
-            )
-
-            if not self.stations["waiting"].has_available_queue():
+            if not self._waiting.has_available_queue():
                 # Waiting queue is full, customer leaves
                 self.customers_left_full_queue += 1
-                self.log_event("ARRIVED_LEFT", customer_id, "waiting", "Queue full")
+                self.log_event(
+                    "ARRIVED_LEFT", f"Customer_{customer_id}", "waiting", "Queue full"
+                )
             else:
                 # Customer can enter
                 self.log_event(
-                    "ARRIVED", customer_id, "", f"Service req: {service_req}"
+                    "ARRIVED",
+                    f"Customer_{customer_id}",
+                    "",
+                    f"Service req: {_mask_to_demands(service_req)}",
                 )
-                self.env.process(
+                env.process(
                     self.customer_process(customer_id, requeue_prob, service_req)
                 )
 
-    def customer_process(
-        self, customer_id, requeue_prob, service_req, is_requeue=False
-    ):
-        start_time = self.env.now
-        waiting_start_time = self.env.now
-
-        # Create a mutable copy of service requirements to track fulfillment
-        current_demands = service_req.copy()
-
-        # Customer enters waiting area first
-        if is_requeue:
-            # Requeued customers go to the front
-            self.waiting_area.insert(0, (customer_id, current_demands, start_time))
-        else:
-            self.waiting_area.append((customer_id, current_demands, start_time))
-
-        self.log_event("ENTER_WAITING", customer_id, "waiting", "")
-
-        # Process through waiting station with timeout monitoring
-        waiting_process = self.env.process(self.stations["waiting"].serve(customer_id))
-        timeout_process = self.env.timeout(20)  # 20 minutes max wait
-
-        # Wait for either service completion or timeout
-        result = yield waiting_process | timeout_process
-
-        # Check if customer waited too long
-        if timeout_process in result:
-            # Customer waited more than 20 minutes, leaves
-            self.customers_left_excessive_wait += 1
-            self.log_event("LEFT", customer_id, "waiting", "Excessive wait (>20 min)")
-            return
-
-        # Check dining capacity constraint before leaving waiting
-        dining_capacity = self.get_dining_total_capacity()
+    def customer_process(self, customer_id, requeue_prob, service_req):
+        # Unmet demands live in a 3-bit mask (bit i = food station i), so
+        # per-round checks are single-int ops instead of list sums
+        demand_mask = service_req
+
+        # Log label for this pass; requeue/unmet passes append a suffix
+        label = f"Customer_{customer_id}"
+
+        # Hoist the environment, station bindings and log method out of
+        # the loop: locals instead of attribute/dict lookups per pass
+        env = self.env
+        log_event = self.log_event
+        waiting = self._waiting
+        food_stations = self._food_stations
+        dining = self._dining
+
+        # One flat loop per customer lifetime: requeue and unmet-demand
+        # returns continue the loop instead of spawning a nested process
+        # (one generator frame per customer instead of one per pass)
         while True:
-            customers_in_service = self.get_total_service_station_customers()
-            if customers_in_service < dining_capacity:
-                break
-            # Wait until capacity frees up
-            yield self.env.timeout(0.1)
-
-        self.log_event("EXIT_WAITING", customer_id, "waiting", "")
-
-        # Define station order: appetizer -> main_course -> dessert
-        station_order = ["appetizer", "main_course", "dessert"]
-
-        # Keep trying to fulfill demands until all are met
-        while sum(current_demands) > 0:  # While there are unmet demands
-            demand_met_this_round = False
-
-            # Check each station in order
-            for i, station_name in enumerate(station_order):
-                if current_demands[i] == 1:  # Customer needs this station
-                    # Check if station has available queue space
-                    if self.stations[station_name].has_available_queue():
-                        # Increment counter before entering service station
-                        self.customers_in_service_stations += 1
-                        self.log_event("ENTER_STATION", customer_id, station_name, "")
-                        # Proceed to station and get service
-                        yield self.env.process(
-                            self.stations[station_name].serve(customer_id)
-                        )
-                        # Decrement counter after leaving service station
-                        self.customers_in_service_stations -= 1
-                        self.log_event("EXIT_STATION", customer_id, station_name, "")
-                        # Mark this demand as fulfilled
-                        current_demands[i] = 0
-                        demand_met_this_round = True
-                    # If queue is full, skip to next station
-
-            # If no demands were met this round, customer goes back to waiting
-            if not demand_met_this_round and sum(current_demands) > 0:
-                # Customer returns to waiting area (back of queue)
-                self.waiting_area.append((customer_id, current_demands, start_time))
-                self.log_event(
-                    "RETURN_WAITING",
-                    customer_id,
-                    "waiting",
-                    f"Unmet demands: {current_demands}",
-                )
-
-                # Process through waiting station again with timeout
-                waiting_process = self.env.process(
-                    self.stations["waiting"].serve(customer_id)
+            start_time = env.now
+
+            log_event("ENTER_WAITING", label, "waiting", "")
+
+            # Serve in this frame, then apply the 20-minute cutoff.  The
+            # renege decision is the same as racing a timeout event (the
+            # raced serve ran to completion in the background anyway), but
+            # without a timeout plus condition event allocation per pass
+            yield from waiting.serve()
+
+            # Check if customer waited too long
+            if env.now - start_time > 20:
+                # Customer waited more than 20 minutes, leaves
+                self.customers_left_excessive_wait += 1
+                log_event(
+                    "LEFT", label, "waiting", "Excessive wait (>20 min)"
                 )
-                timeout_process = self.env.timeout(20)
-                result = yield waiting_process | timeout_process
-
-                if timeout_process in result:
-                    self.customers_left_excessive_wait += 1
-                    self.log_event(
-                        "LEFT",
-                        customer_id,
+                return
+
+            # Check dining capacity constraint before leaving waiting.
+            # Instead of polling every 0.1 min, block on an event that a
+            # finishing food-station customer triggers when capacity frees up.
+            dining_capacity = self.get_dining_total_capacity()
+            # customers_in_service_stations counts queue + in-service
+            # across the three food stations, maintained at enter/exit
+            while self.customers_in_service_stations >= dining_capacity:
+                capacity_event = env.event()
+                self.capacity_waiters.append(capacity_event)
+                yield capacity_event
+
+            log_event("EXIT_WAITING", label, "waiting", "")
+
+            # Keep trying to fulfill demands until all are met
+            while demand_mask:  # While there are unmet demands
+                demand_met_this_round = False
+
+                # Check each station in order: appetizer -> main_course -> dessert
+                for i, (station_name, station) in enumerate(food_stations):
+                    if demand_mask & (1 << i):  # Customer needs this station
+                        # Check if station has available queue space
+                        if station.has_available_queue():
+                            # Increment counter before entering service station
+                            self.customers_in_service_stations += 1
+                            log_event(
+                                "ENTER_STATION", label, station_name, ""
+                            )
+                            # Proceed to station and get service.  yield
+                            # from runs serve() in this process's frame
+                            # instead of spawning a child Process
+                            yield from station.serve()
+                            # Decrement counter after leaving service station
+                            self.customers_in_service_stations -= 1
+                            log_event(
+                                "EXIT_STATION", label, station_name, ""
+                            )
+                            # A food-station slot freed up: wake a blocked customer
+                            self._wake_one(self.capacity_waiters)
+                            # Mark this demand as fulfilled
+                            demand_mask &= ~(1 << i)
+                            demand_met_this_round = True
+                        # If queue is full, skip to next station
+
+                # If no demands were met this round, customer goes back to
+                # waiting.  demand_mask is unchanged (and was non-zero to
+                # enter the round), so no second emptiness check is needed
+                if not demand_met_this_round:
+                    log_event(
+                        "RETURN_WAITING",
+                        label,
                         "waiting",
-                        "Excessive wait on return (>20 min)",
+                        f"Unmet demands: {_mask_to_demands(demand_mask)}",
                     )
-                    return
-
-        # All food station demands are met, now go to dining station
-        while not self.stations["dining"].has_available_queue():
-            yield self.env.timeout(0.1)  # Wait for space
-
-        self.log_event("ENTER_STATION", customer_id, "dining", "")
-        yield self.env.process(self.stations["dining"].serve(customer_id))
-        self.log_event("EXIT_STATION", customer_id, "dining", "")
 
-        # Track unique customer who completed dining (extract base ID without _requeue suffix)
-        base_customer_id = customer_id.split("_requeue")[0].split("_unmet")[0]
-        self.customers_completed_dining.add(base_customer_id)
-
-        # Calculate total time in system so far
-        time_in_system = self.env.now - start_time
-
-        # After dining, check if there are still unmet demands (shouldn't happen, but check)
-        if sum(current_demands) > 0:
-            # Customer has unmet demands, return to waiting queue
-            self.unmet_demand_returns += 1
-            self.waiting_area.append((customer_id, current_demands, start_time))
-            self.log_event(
-                "REQUEUE_UNMET", customer_id, "", f"Unmet demands: {current_demands}"
-            )
-            yield self.env.process(
-                self.customer_process(
-                    customer_id + "_unmet",
-                    requeue_prob,
-                    current_demands,
-                    is_requeue=False,
-                )
-            )
-        # Check requeue probability for getting more food
-        elif random.random() < requeue_prob:
-            # Check if customer's total time exceeds the max requeue time limit
-            # If max_time_for_requeue is 0, it means unlimited time (no time restriction)
-            if (
-                self.max_time_for_requeue > 0
-                and time_in_system > self.max_time_for_requeue
-            ):
-                # Customer exceeded time limit, not allowed to requeue, must leave
-                self.customers_denied_requeue += 1
-                self.customer_total_times.append(time_in_system)
-                self.completed_customers += 1
-                self.log_event(
-                    "DEPARTED",
-                    customer_id,
+                    # Through the waiting station again, same deadline check
+                    return_start = env.now
+                    yield from waiting.serve()
+
+                    if env.now - return_start > 20:
+                        self.customers_left_excessive_wait += 1
+                        log_event(
+                            "LEFT",
+                            label,
+                            "waiting",
+                            "Excessive wait on return (>20 min)",
+                        )
+                        return
+
+            # All food station demands are met, now go to dining station
+            # (event-driven wait instead of 0.1-minute polling)
+            while not dining.has_available_queue():
+                space_event = env.event()
+                self.dining_queue_waiters.append(space_event)
+                yield space_event
+
+            log_event("ENTER_STATION", label, "dining", "")
+            yield from dining.serve()
+            log_event("EXIT_STATION", label, "dining", "")
+            # A dining slot freed up: wake a blocked customer
+            self._wake_one(self.dining_queue_waiters)
+
+            # Track the unique customer who completed dining (the base int
+            # id is carried directly, nothing to parse out of a label)
+            self._mark_dined(customer_id)
+
+            # Calculate total time in system so far
+            time_in_system = env.now - start_time
+
+            # After dining, check if there are still unmet demands (shouldn't happen, but check)
+            if demand_mask:
+                # Customer has unmet demands, return to waiting queue
+                self.unmet_demand_returns += 1
+                log_event(
+                    "REQUEUE_UNMET",
+                    label,
                     "",
-                    f"Denied requeue (time: {time_in_system:.2f} min)",
+                    f"Unmet demands: {_mask_to_demands(demand_mask)}",
                 )
-            else:
+                label = label + "_unmet"
+                continue
+
+            # Check requeue probability for getting more food
+            if RNG.random() < requeue_prob:
+                # Check if customer's total time exceeds the max requeue time limit
+                # If max_time_for_requeue is 0, it means unlimited time (no time restriction)
+                if (
+                    self.max_time_for_requeue > 0
+                    and time_in_system > self.max_time_for_requeue
+                ):
+                    # Customer exceeded time limit, not allowed to requeue, must leave
+                    self.customers_denied_requeue += 1
+                    self._record_total_time(time_in_system)
+                    self.completed_customers += 1
+                    log_event(
+                        "DEPARTED",
+                        label,
+                        "",
+                        f"Denied requeue (time: {time_in_system:.2f} min)",
+                    )
+                    return
+
                 # Customer is within time limit (or no limit), allow requeue
                 self.requeue_count += 1
                 # Generate new service requirement for requeue
                 new_service_req = self.generate_service_requirement()
-                self.log_event(
-                    "REQUEUE", customer_id, "", f"New req: {new_service_req}"
+                log_event(
+                    "REQUEUE", label, "", f"New req: {_mask_to_demands(new_service_req)}"
                 )
-                self.env.process(
-                    self.customer_process(
-                        customer_id + "_requeue",
-                        requeue_prob,
-                        new_service_req,
-                        is_requeue=True,
-                    )
-                )
-        else:
+                demand_mask = new_service_req
+                label = label + "_requeue"
+                continue
+
             # Customer leaves the system
-            self.customer_total_times.append(time_in_system)
+            self._record_total_time(time_in_system)
             self.completed_customers += 1
-            self.log_event(
-                "DEPARTED", customer_id, "", f"Total time: {time_in_system:.2f} min"
+            log_event(
+                "DEPARTED", label, "", f"Total time: {time_in_system:.2f} min"
             )
+            return
 
     def station_monitor(self, until_time):
         """Monitor and log station conditions every minute"""
@@ -391,11 +646,14 @@ class BuffetSimulation:
         arrival_rate,
         station_configs,
         max_time_for_requeue,
+        collect_stats=True,
     ):
-        self.setup_stations(station_configs)
+        self.setup_stations(station_configs, collect_stats)
         self.max_time_for_requeue = max_time_for_requeue
 
-        self.env.process(self.generate_arrivals(mean_arrival_time, requeue_prob))
+        self.env.process(
+            self.generate_arrivals(mean_arrival_time, requeue_prob, until_time)
+        )
         self.env.process(self.station_monitor(until_time))
 
         print(f"=== Running Simulation for {until_time} minutes ===")
@@ -422,117 +680,118 @@ class BuffetSimulation:
         self.print_station_timeline()
 
     def print_results(self):
-        print("=" * 70)
-        print("SIMULATION RESULTS")
-        print("=" * 70)
-
-        print(f"\n--- Overall Statistics ---")
-        print(f"Total customers arrived: {self.total_customers}")
-        print(f"Customers completed: {self.completed_customers}")
+        # Batch the whole report into one stdout write instead of a few
+        # hundred print() calls (per-server breakdowns dominate the count)
+        out = []
+        out.append("=" * 70)
+        out.append("SIMULATION RESULTS")
+        out.append("=" * 70)
+
+        out.append(f"\n--- Overall Statistics ---")
+        out.append(f"Total customers arrived: {self.total_customers}")
+        out.append(f"Customers completed: {self.completed_customers}")
         customers_left = (
             self.customers_left_full_queue + self.customers_left_excessive_wait
         )
-        print(
+        out.append(
             f"Customers still in system: {self.total_customers - self.completed_customers - customers_left}"
         )
-        print(
-            f"Unique customers who completed dining: {len(self.customers_completed_dining)}"
+        out.append(f"Unique customers who completed dining: {self.unique_diners}")
+        out.append(f"Re-queue events (after dining): {self.requeue_count}")
+        out.append(f"Number of customers who requeued: {self.requeue_count}")
+        out.append(f"Returns to waiting (unmet demands): {self.unmet_demand_returns}")
+        out.append(f"\n--- Customers Who Left ---")
+        out.append(
+            f"Left because waiting queue was full: {self.customers_left_full_queue}"
         )
-        print(f"Re-queue events (after dining): {self.requeue_count}")
-        print(f"Number of customers who requeued: {self.requeue_count}")
-        print(f"Returns to waiting (unmet demands): {self.unmet_demand_returns}")
-        print(f"\n--- Customers Who Left ---")
-        print(f"Left because waiting queue was full: {self.customers_left_full_queue}")
-        print(
+        out.append(
             f"Left because of excessive waiting (>20 min): {self.customers_left_excessive_wait}"
         )
-        print(
+        out.append(
             f"Left because denied requeue (exceeded max time): {self.customers_denied_requeue}"
         )
-        print(f"Total customers who left: {customers_left}")
+        out.append(f"Total customers who left: {customers_left}")
 
-        if self.customer_total_times:
-            avg_total_time = statistics.mean(self.customer_total_times)
-            max_total_time = max(self.customer_total_times)
-            min_total_time = min(self.customer_total_times)
-            print(f"\nAverage time in system: {avg_total_time:.2f} minutes")
-            print(f"Max time in system: {max_total_time:.2f} minutes")
-            print(f"Min time in system: {min_total_time:.2f} minutes")
+        if self.tt_n:
+            out.append(
+                f"\nAverage time in system: {self.tt_sum / self.tt_n:.2f} minutes"
+            )
+            out.append(f"Max time in system: {self.tt_max:.2f} minutes")
+            out.append(f"Min time in system: {self.tt_min:.2f} minutes")
 
-        print("\n" + "=" * 70)
-        print("STATION-BY-STATION METRICS")
-        print("=" * 70)
+        out.append("\n" + "=" * 70)
+        out.append("STATION-BY-STATION METRICS")
+        out.append("=" * 70)
 
         for name, station in self.stations.items():
-            print(f"\n--- {name} ---")
-            print(f"Servers: {station.num_servers}")
-            print(f"Customers served: {station.customers_served}")
+            out.append(f"\n--- {name} ---")
+            out.append(f"Servers: {station.num_servers}")
+            out.append(f"Customers served: {station.customers_served}")
 
             # WAIT TIME
-            avg_wait = statistics.mean(station.wait_times) if station.wait_times else 0
-            max_wait = max(station.wait_times) if station.wait_times else 0
-            print(f"Average wait time: {avg_wait:.2f} minutes")
-            print(f"Max wait time: {max_wait:.2f} minutes")
+            avg_wait, max_wait = station.get_wait_stats()
+            out.append(f"Average wait time: {avg_wait:.2f} minutes")
+            out.append(f"Max wait time: {max_wait:.2f} minutes")
 
             # SERVICE TIME
-            avg_service = (
-                statistics.mean(station.service_times) if station.service_times else 0
+            out.append(
+                f"Average service time: {station.get_avg_service_time():.2f} minutes"
             )
-            print(f"Average service time: {avg_service:.2f} minutes")
 
             # QUEUE LENGTH (Overall)
-            avg_queue = (
-                statistics.mean(station.queue_lengths) if station.queue_lengths else 0
-            )
-            max_queue = max(station.queue_lengths) if station.queue_lengths else 0
-            print(f"Average queue length: {avg_queue:.2f}")
-            print(f"Max queue length: {max_queue}")
+            avg_queue, max_queue = station.get_queue_stats()
+            out.append(f"Average queue length: {avg_queue:.2f}")
+            out.append(f"Max queue length: {max_queue}")
 
             # PER-SERVER STATISTICS (M/M/c model - servers share one queue)
-            print(f"\n  Per-Server Breakdown (approximate distribution):")
+            out.append(f"\n  Per-Server Breakdown (approximate distribution):")
             for i in range(station.num_servers):
-                print(f"    Server {i + 1}:")
-                print(f"      Customers served: {station.server_customers_served[i]}")
+                out.append(f"    Server {i + 1}:")
+                out.append(
+                    f"      Customers served: {station.server_customers_served[i]}"
+                )
 
             # Current queue status
-            current_queue = len(station.resource.queue)
-            current_in_service = station.resource.count
-            print(f"\n  Current status (end of sim):")
-            print(f"    Customers in queue: {current_queue}")
-            print(f"    Customers being served: {current_in_service}")
+            current_queue = station.get_current_queue_length()
+            current_in_service = station.get_current_in_service()
+            out.append(f"\n  Current status (end of sim):")
+            out.append(f"    Customers in queue: {current_queue}")
+            out.append(f"    Customers being served: {current_in_service}")
 
             # UTILIZATION
-            if station.service_times:
-                total_service_time = sum(station.service_times)
-                utilization = (
-                    total_service_time / (self.env.now * station.num_servers)
-                ) * 100
-            else:
-                utilization = 0
-            print(f"\nServer utilization: {utilization:.2f}%")
+            total_service_time = station.get_total_service_time()
+            utilization = (
+                total_service_time / (self.env.now * station.num_servers)
+            ) * 100
+            out.append(f"\nServer utilization: {utilization:.2f}%")
+
+        out.append("")
+        sys.stdout.write("\n".join(out))
 
     def print_event_log(self):
         """Print chronological event log"""
-        print("\n" + "=" * 70)
-        print("CUSTOMER EVENT LOG (Chronological)")
-        print("=" * 70)
-        print(f"{'Event':<20} {'Customer':<20} {'Station':<15} {'Details'}")
-        print("-" * 70)
+        out = [
+            "\n" + "=" * 70,
+            "CUSTOMER EVENT LOG (Chronological)",
+            "=" * 70,
+            f"{'Event':<20} {'Customer':<20} {'Station':<15} {'Details'}",
+            "-" * 70,
+        ]
 
         for event in self.event_log:
-            print(
+            out.append(
                 f"{event['event']:<20} {event['customer']:<20} {event['station']:<15} {event['details']}"
             )
+        out.append("")
+        sys.stdout.write("\n".join(out))
 
     def print_station_timeline(self):
         """Print station conditions at each minute"""
-        print("\n" + "=" * 70)
-        print("STATION CONDITIONS TIMELINE (Every Minute)")
-        print("=" * 70)
+        out = ["\n" + "=" * 70, "STATION CONDITIONS TIMELINE (Every Minute)", "=" * 70]
 
         for snapshot in self.station_snapshots:
             time_point = snapshot["time"]
-            print(f"\n--- Time: {time_point:.1f} minutes ---")
+            out.append(f"\n--- Time: {time_point:.1f} minutes ---")
 
             for station_name in [
                 "waiting",
@@ -543,9 +802,1025 @@ class BuffetSimulation:
             ]:
                 if station_name in snapshot:
                     stats = snapshot[station_name]
-                    print(
+                    out.append(
                         f"  {station_name.capitalize():<15}: Queue={stats['queue_length']:<3} InService={stats['in_service']:<3} TotalServed={stats['total_served']}"
                     )
+        out.append("")
+        sys.stdout.write("\n".join(out))
+
+
+# -------------------------------------------
+#          FAST EVENT-LOOP ENGINE
+# -------------------------------------------
+# Purpose-built discrete-event core that replaces SimPy's generator-based
+# scheduler with a flat heapq event loop.  Each station is just a busy-server
+# count plus a FIFO deque, so dispatching one event costs a handful of
+# bytecodes instead of a full generator resume.  The SimPy classes above are
+# kept as the validated reference implementation (--engine simpy).
+
+# Event kinds for the fast engine
+EV_ARRIVAL = 0
+EV_SERVICE_END = 1
+EV_SNAPSHOT = 2
+
+# The topology is fixed, so stations get integer indices and the fast
+# engine's hot path works on a list indexed by these instead of the
+# name-keyed dict (kept only for the shared reporting code)
+WAIT = 0
+APP = 1
+MAIN = 2
+DESS = 3
+DINE = 4
+STATION_NAMES = ("waiting", "appetizer", "main_course", "dessert", "dining")
+
+# Max waiting time before a customer gives up (minutes), same cutoff the
+# SimPy reference path checks after the waiting service
+MAX_WAIT_TIME = 20
+
+
+# The event heap is stored as parallel typed arrays (times/seqs/kinds plus an
+# index into a Python-side payload table) so the sift-up/sift-down kernels can
+# be compiled by Numba; heap order is (time, seq) to keep FIFO tie-breaking.
+
+
+@njit(cache=True)
+def _heap_push(times, seqs, kinds, pidxs, n, t, seq, kind, pidx):
+    """Insert one event into the array heap of current size n."""
+    i = n
+    times[i] = t
+    seqs[i] = seq
+    kinds[i] = kind
+    pidxs[i] = pidx
+    while i > 0:
+        parent = (i - 1) >> 1
+        if times[i] < times[parent] or (
+            times[i] == times[parent] and seqs[i] < seqs[parent]
+        ):
+            times[i], times[parent] = times[parent], times[i]
+            seqs[i], seqs[parent] = seqs[parent], seqs[i]
+            kinds[i], kinds[parent] = kinds[parent], kinds[i]
+            pidxs[i], pidxs[parent] = pidxs[parent], pidxs[i]
+            i = parent
+        else:
+            break
+
+
+@njit(cache=True)
+def _heap_pop(times, seqs, kinds, pidxs, n):
+    """Remove and return the root event; returns (t, kind, pidx)."""
+    t = times[0]
+    kind = kinds[0]
+    pidx = pidxs[0]
+    n -= 1
+    times[0] = times[n]
+    seqs[0] = seqs[n]
+    kinds[0] = kinds[n]
+    pidxs[0] = pidxs[n]
+    i = 0
+    while True:
+        left = 2 * i + 1
+        if left >= n:
+            break
+        smallest = left
+        right = left + 1
+        if right < n and (
+            times[right] < times[left]
+            or (times[right] == times[left] and seqs[right] < seqs[left])
+        ):
+            smallest = right
+        if times[smallest] < times[i] or (
+            times[smallest] == times[i] and seqs[smallest] < seqs[i]
+        ):
+            times[i], times[smallest] = times[smallest], times[i]
+            seqs[i], seqs[smallest] = seqs[smallest], seqs[i]
+            kinds[i], kinds[smallest] = kinds[smallest], kinds[i]
+            pidxs[i], pidxs[smallest] = pidxs[smallest], pidxs[i]
+            i = smallest
+        else:
+            break
+    return t, kind, pidx
+
+
+class _Clock:
+    """Minimal stand-in for simpy.Environment so the reporting code that
+    reads `self.env.now` works unchanged with the fast engine."""
+
+    def __init__(self):
+        self.now = 0.0
+
+
+class FastStation:
+    """M/M/c station for the fast engine: busy-server count + FIFO deque.
+
+    Exposes the same statistics attributes and accessor methods as
+    ServiceStation so BuffetSimulation's reporting can be reused as-is.
+    """
+
+    # Slot layout for the same reason as ServiceStation
+    __slots__ = (
+        "env",
+        "num_servers",
+        "mean_service_time",
+        "queue_capacity",
+        "collect_stats",
+        "busy",
+        "queue",
+        "rng",
+        "_svc_buf",
+        "_svc_idx",
+        "wt_n",
+        "wt_sum",
+        "wt_max",
+        "st_n",
+        "st_sum",
+        "q_area",
+        "q_last_update",
+        "q_max",
+        "customers_served",
+        "server_customers_served",
+        "next_server",
+        "has_available_queue",
+        "_cap_int",
+    )
+
+    # Exponential service-time variates are drawn in batches of this size
+    SERVICE_BATCH = 1024
+
+    def __init__(
+        self,
+        env,
+        num_servers,
+        mean_service_time,
+        rng,
+        queue_capacity=float("inf"),
+        collect_stats=True,
+    ):
+        self.env = env
+        self.num_servers = num_servers
+        self.mean_service_time = mean_service_time
+        self.queue_capacity = queue_capacity
+        self.collect_stats = collect_stats
+
+        self.busy = 0  # servers currently serving
+        self.queue = deque()  # (customer, enqueue_time) waiting for a server
+
+        # Pre-drawn service times consumed via a cursor (one vectorized
+        # RNG call per batch instead of one Python call per customer)
+        self.rng = rng
+        self._svc_buf = rng.exponential(mean_service_time, self.SERVICE_BATCH)
+        self._svc_idx = 0
+
+        # Running accumulators instead of unbounded per-customer sample
+        # lists: O(1) memory per station and no reduction pass at the end
+        self.wt_n = 0
+        self.wt_sum = 0.0
+        self.wt_max = 0.0
+        self.st_n = 0
+        self.st_sum = 0.0
+        # Time-weighted queue-length integral, as in ServiceStation
+        self.q_area = 0.0
+        self.q_last_update = 0.0
+        self.q_max = 0
+        self.customers_served = 0
+
+        self.server_customers_served = [0 for _ in range(num_servers)]
+        self.next_server = 0  # Round-robin assignment for tracking
+
+        # Same capacity-check specialization as ServiceStation
+        if queue_capacity == float("inf"):
+            self.has_available_queue = lambda: True
+        else:
+            self._cap_int = int(queue_capacity)
+            self.has_available_queue = lambda: len(self.queue) < self._cap_int
+
+    def get_current_queue_length(self):
+        """Get current queue length (customers waiting, not being served)"""
+        return len(self.queue)
+
+    def get_current_in_service(self):
+        """Get number of customers currently being served"""
+        return self.busy
+
+    def next_service_time(self):
+        """Pop the next pre-drawn exponential service time, refilling the
+        batch when exhausted."""
+        if self._svc_idx == len(self._svc_buf):
+            self._svc_buf = self.rng.exponential(
+                self.mean_service_time, self.SERVICE_BATCH
+            )
+            self._svc_idx = 0
+        value = self._svc_buf[self._svc_idx]
+        self._svc_idx += 1
+        return value
+
+    def record_wait(self, wait_time):
+        if not self.collect_stats:
+            return
+        self.wt_n += 1
+        self.wt_sum += wait_time
+        if wait_time > self.wt_max:
+            self.wt_max = wait_time
+
+    def record_service(self, service_time):
+        if not self.collect_stats:
+            return
+        self.st_n += 1
+        self.st_sum += service_time
+
+    def _advance_queue_clock(self):
+        """Accumulate queue-length x elapsed-time up to the current time."""
+        if not self.collect_stats:
+            return
+        now = self.env.now
+        if now > self.q_last_update:
+            self.q_area += len(self.queue) * (now - self.q_last_update)
+            self.q_last_update = now
+
+    def get_wait_stats(self):
+        """Return (average, max) waiting time"""
+        if not self.wt_n:
+            return 0, 0
+        return self.wt_sum / self.wt_n, self.wt_max
+
+    def get_avg_service_time(self):
+        """Return average service time"""
+        return self.st_sum / self.st_n if self.st_n else 0
+
+    def get_total_service_time(self):
+        """Return total busy time across all servers (for utilization)"""
+        return self.st_sum
+
+    def get_queue_stats(self):
+        """Return (time-weighted average, max) queue length"""
+        self._advance_queue_clock()
+        now = self.env.now
+        if now == 0:
+            return 0, 0
+        return self.q_area / now, self.q_max
+
+
+class FastBuffetSimulation(BuffetSimulation):
+    """Buffet simulation on the fast heapq event loop.
+
+    Same model, counters and reports as the SimPy-based BuffetSimulation;
+    only the event dispatch machinery differs.
+    """
+
+    # Initial capacity of the typed event-heap arrays (doubled on overflow)
+    INITIAL_HEAP_SIZE = 1024
+
+    def __init__(self):
+        super().__init__()
+        self.env = _Clock()
+        # Typed array heap consumed by the Numba kernels
+        size = self.INITIAL_HEAP_SIZE
+        self.heap_times = np.empty(size, dtype=np.float64)
+        self.heap_seqs = np.empty(size, dtype=np.int64)
+        self.heap_kinds = np.empty(size, dtype=np.int8)
+        self.heap_pidxs = np.empty(size, dtype=np.int32)
+        self.heap_n = 0
+        self._next_seq = 0
+        # Event payloads stay on the Python side; the heap carries an index
+        self._payloads = []
+        self._free_payload_slots = []
+        self.n_food = 0  # customers in food-station queues + service
+        self.dining_gate_waiters = deque()  # blocked on the dining-capacity gate
+        self.dining_space_waiters = deque()  # blocked on a full dining queue
+
+    # --- SoA per-customer state ------------------------------------------
+    # Customer state lives in flat parallel arrays indexed by integer id,
+    # replacing a per-customer Python object (and the string ids the SimPy
+    # path formats and re-parses).  Requeues reuse the same slot, bumping
+    # the generation counter used only for log labels.
+
+    def _alloc_customer_state(self, n):
+        self.c_start = np.zeros(n, dtype=np.float64)
+        # 3-bit demand mask: bit 0 = appetizer, 1 = main course, 2 = dessert
+        self.c_demands = np.zeros(n, dtype=np.uint8)
+        self.c_generation = np.zeros(n, dtype=np.int16)
+        self.c_wait_start = np.zeros(n, dtype=np.float64)
+        self.c_initial_pass = np.zeros(n, dtype=bool)
+        self.c_round_pos = np.zeros(n, dtype=np.uint8)
+        self.c_round_met = np.zeros(n, dtype=bool)
+
+    def _grow_customer_state(self):
+        n = 2 * len(self.c_start)
+        self.c_start = np.resize(self.c_start, n)
+        self.c_demands = np.resize(self.c_demands, n)
+        self.c_generation = np.resize(self.c_generation, n)
+        self.c_wait_start = np.resize(self.c_wait_start, n)
+        self.c_initial_pass = np.resize(self.c_initial_pass, n)
+        self.c_round_pos = np.resize(self.c_round_pos, n)
+        self.c_round_met = np.resize(self.c_round_met, n)
+
+    def _label(self, cid):
+        """Log label matching the reference engine's string ids."""
+        return f"Customer_{cid}" + "_requeue" * int(self.c_generation[cid])
+
+    def _demands_list(self, cid):
+        """Decode the demand bitmask into the n/n/n list form used in logs."""
+        return _mask_to_demands(int(self.c_demands[cid]))
+
+    def schedule(self, t, kind, payload=None):
+        if self._free_payload_slots:
+            pidx = self._free_payload_slots.pop()
+            self._payloads[pidx] = payload
+        else:
+            pidx = len(self._payloads)
+            self._payloads.append(payload)
+        if self.heap_n == len(self.heap_times):
+            self.heap_times = np.resize(self.heap_times, 2 * self.heap_n)
+            self.heap_seqs = np.resize(self.heap_seqs, 2 * self.heap_n)
+            self.heap_kinds = np.resize(self.heap_kinds, 2 * self.heap_n)
+            self.heap_pidxs = np.resize(self.heap_pidxs, 2 * self.heap_n)
+        _heap_push(
+            self.heap_times,
+            self.heap_seqs,
+            self.heap_kinds,
+            self.heap_pidxs,
+            self.heap_n,
+            t,
+            self._next_seq,
+            kind,
+            pidx,
+        )
+        self.heap_n += 1
+        self._next_seq += 1
+
+    def _pop_event(self):
+        t, kind, pidx = _heap_pop(
+            self.heap_times,
+            self.heap_seqs,
+            self.heap_kinds,
+            self.heap_pidxs,
+            self.heap_n,
+        )
+        self.heap_n -= 1
+        payload = self._payloads[pidx]
+        self._payloads[pidx] = None
+        self._free_payload_slots.append(pidx)
+        return t, kind, payload
+
+    def _build_stations(self, configs, collect_stats):
+        self.station_list = [None] * len(STATION_NAMES)
+        for config in configs:
+            station = FastStation(
+                self.env,
+                config.num_servers,
+                config.mean_service_time,
+                self.rng,
+                config.queue_capacity,
+                collect_stats,
+            )
+            self.stations[config.name] = station
+            self.station_list[STATION_NAMES.index(config.name)] = station
+
+        # Same constant dining-capacity cache as the SimPy engine
+        dining = self.station_list[DINE]
+        if dining.queue_capacity == float("inf"):
+            self._dining_total_cap = float("inf")
+        else:
+            self._dining_total_cap = int(dining.queue_capacity) + dining.num_servers
+
+    # --- pre-generated randomness ---------------------------------------
+
+    def _pregenerate(self, until_time, mean_arrival_time):
+        """Draw the whole Poisson arrival schedule and the 3-bit service
+        requirement masks in bulk NumPy calls before the run starts."""
+        n_est = max(64, int(1.5 * until_time / mean_arrival_time))
+        arrival_times = np.cumsum(self.rng.exponential(mean_arrival_time, n_est))
+        while arrival_times[-1] < until_time:
+            extra = np.cumsum(self.rng.exponential(mean_arrival_time, n_est))
+            arrival_times = np.concatenate([arrival_times, arrival_times[-1] + extra])
+        self._arrival_times = arrival_times
+        self._arrival_idx = 0
+        # Masks 1..7 are exactly the non-zero appetizer/main/dessert
+        # combinations, so no rejection loop is needed
+        self._req_masks = self.rng.integers(1, 8, len(arrival_times), dtype=np.uint8)
+        self._req_idx = 0
+        # Customer ids start at 1 and never exceed the number of external
+        # arrivals (requeues reuse their slot); +1 for the unused slot 0
+        self._alloc_customer_state(len(arrival_times) + 1)
+
+    def _next_arrival_time(self):
+        if self._arrival_idx == len(self._arrival_times):
+            extra = np.cumsum(
+                self.rng.exponential(self._mean_arrival_time, len(self._arrival_times))
+            )
+            self._arrival_times = np.concatenate(
+                [self._arrival_times, self._arrival_times[-1] + extra]
+            )
+        value = self._arrival_times[self._arrival_idx]
+        self._arrival_idx += 1
+        return value
+
+    def _next_requirement_mask(self):
+        """Pop the next pre-drawn 3-bit requirement mask (refilling in batch)."""
+        if self._req_idx == len(self._req_masks):
+            self._req_masks = self.rng.integers(
+                1, 8, len(self._req_masks), dtype=np.uint8
+            )
+            self._req_idx = 0
+        mask = int(self._req_masks[self._req_idx])
+        self._req_idx += 1
+        return mask
+
+    # --- event handlers -------------------------------------------------
+
+    def _handle_arrival(self, _payload):
+        # Schedule the next external arrival from the pre-drawn schedule
+        self.schedule(self._next_arrival_time(), EV_ARRIVAL)
+
+        self.customer_count += 1
+        self.total_customers += 1
+        cid = self.customer_count
+        if cid >= len(self.c_start):
+            self._grow_customer_state()
+        self.c_start[cid] = self.env.now
+        self.c_demands[cid] = self._next_requirement_mask()
+        self.c_generation[cid] = 0
+        self.c_initial_pass[cid] = True
+        self.c_round_pos[cid] = 0
+        self.c_round_met[cid] = False
+
+        if not self.station_list[WAIT].has_available_queue():
+            self.customers_left_full_queue += 1
+            self.log_event("ARRIVED_LEFT", self._label(cid), "waiting", "Queue full")
+            return
+
+        self.log_event(
+            "ARRIVED", self._label(cid), "", f"Service req: {self._demands_list(cid)}"
+        )
+        self._enter_waiting(cid)
+
+    def _enter_waiting(self, cid):
+        self.c_wait_start[cid] = self.env.now
+        self.log_event("ENTER_WAITING", self._label(cid), "waiting", "")
+        self._enter_station(WAIT, cid)
+
+    def _enter_station(self, idx, cid):
+        """Advance the queue integral, then start service or join the queue."""
+        station = self.station_list[idx]
+        station._advance_queue_clock()
+        if station.busy < station.num_servers:
+            self._start_service(idx, cid, self.env.now)
+        else:
+            station.queue.append((cid, self.env.now))
+            if station.collect_stats:
+                queue_length = len(station.queue)
+                if queue_length > station.q_max:
+                    station.q_max = queue_length
+
+    def _start_service(self, idx, cid, enqueue_time):
+        station = self.station_list[idx]
+        station.busy += 1
+        station.record_wait(self.env.now - enqueue_time)
+
+        server_index = station.next_server
+        station.next_server = (station.next_server + 1) % station.num_servers
+
+        service_time = station.next_service_time()
+        station.record_service(service_time)
+        self.schedule(
+            self.env.now + service_time, EV_SERVICE_END, (idx, cid, server_index)
+        )
+
+    def _handle_service_end(self, idx, cid, server_index):
+        station = self.station_list[idx]
+        station.busy -= 1
+        station.customers_served += 1
+        station.server_customers_served[server_index] += 1
+
+        # Hand the freed server to the head of the queue
+        if station.queue:
+            station._advance_queue_clock()
+            next_cid, enqueue_time = station.queue.popleft()
+            self._start_service(idx, next_cid, enqueue_time)
+
+        if idx == WAIT:
+            # 20-minute cutoff applied after the waiting service, matching
+            # the reference path's deadline check
+            if self.env.now - self.c_wait_start[cid] > MAX_WAIT_TIME:
+                self.customers_left_excessive_wait += 1
+                on_return = "" if self.c_initial_pass[cid] else " on return"
+                self.log_event(
+                    "LEFT",
+                    self._label(cid),
+                    "waiting",
+                    f"Excessive wait{on_return} (>{MAX_WAIT_TIME} min)",
+                )
+                return
+            if self.c_initial_pass[cid]:
+                self.c_initial_pass[cid] = False
+                self._pass_dining_gate(cid)
+            else:
+                # Returning from an unmet-demand round: skip the gate
+                self._begin_round(cid)
+        elif idx == DINE:
+            self._wake_dining_space_waiters()
+            self._finish_dining(cid)
+        else:
+            # Food station completed
+            self.n_food -= 1
+            self.log_event("EXIT_STATION", self._label(cid), STATION_NAMES[idx], "")
+            self._wake_dining_gate_waiters()
+            self.c_round_met[cid] = True
+            self.c_round_pos[cid] += 1
+            self._advance_round(cid)
+
+    def _pass_dining_gate(self, cid):
+        """Dining-capacity gate: same check as the reference path's
+        customers_in_service_stations < dining capacity."""
+        if self.n_food < self.get_dining_total_capacity():
+            self.log_event("EXIT_WAITING", self._label(cid), "waiting", "")
+            self._begin_round(cid)
+        else:
+            self.dining_gate_waiters.append(cid)
+
+    def _wake_dining_gate_waiters(self):
+        while (
+            self.dining_gate_waiters
+            and self.n_food < self.get_dining_total_capacity()
+        ):
+            cid = self.dining_gate_waiters.popleft()
+            self.log_event("EXIT_WAITING", self._label(cid), "waiting", "")
+            self._begin_round(cid)
+
+    def _begin_round(self, cid):
+        self.c_round_pos[cid] = 0
+        self.c_round_met[cid] = False
+        self._advance_round(cid)
+
+    def _advance_round(self, cid):
+        """Walk the appetizer -> main_course -> dessert order, entering the
+        first needed station with queue space (resumed after each service)."""
+        mask = int(self.c_demands[cid])
+        while self.c_round_pos[cid] < 3:
+            i = self.c_round_pos[cid]
+            idx = APP + i  # food stations are contiguous indices 1..3
+            if (mask >> i) & 1 and self.station_list[idx].has_available_queue():
+                self.n_food += 1
+                self.c_demands[cid] = mask & ~(1 << i)
+                self.log_event(
+                    "ENTER_STATION", self._label(cid), STATION_NAMES[idx], ""
+                )
+                self._enter_station(idx, cid)
+                return  # resumes in _handle_service_end
+            self.c_round_pos[cid] += 1
+
+        # Round over
+        if mask:
+            if self.c_round_met[cid]:
+                self._begin_round(cid)
+            else:
+                # No demand could be met this round: back to waiting
+                self.log_event(
+                    "RETURN_WAITING",
+                    self._label(cid),
+                    "waiting",
+                    f"Unmet demands: {self._demands_list(cid)}",
+                )
+                self._enter_waiting(cid)
+        else:
+            self._enter_dining(cid)
+
+    def _enter_dining(self, cid):
+        if self.station_list[DINE].has_available_queue():
+            self.log_event("ENTER_STATION", self._label(cid), "dining", "")
+            self._enter_station(DINE, cid)
+        else:
+            self.dining_space_waiters.append(cid)
+
+    def _wake_dining_space_waiters(self):
+        while (
+            self.dining_space_waiters
+            and self.station_list[DINE].has_available_queue()
+        ):
+            self._enter_dining(self.dining_space_waiters.popleft())
+
+    def _finish_dining(self, cid):
+        self.log_event("EXIT_STATION", self._label(cid), "dining", "")
+        # Integer base ids: requeues reuse the same slot, so cid is the base
+        self._mark_dined(cid)
+
+        time_in_system = self.env.now - self.c_start[cid]
+
+        if RNG.random() < self.requeue_prob:
+            if (
+                self.max_time_for_requeue > 0
+                and time_in_system > self.max_time_for_requeue
+            ):
+                self.customers_denied_requeue += 1
+                self._record_total_time(time_in_system)
+                self.completed_customers += 1
+                self.log_event(
+                    "DEPARTED",
+                    self._label(cid),
+                    "",
+                    f"Denied requeue (time: {time_in_system:.2f} min)",
+                )
+            else:
+                self.requeue_count += 1
+                self.c_generation[cid] += 1
+                self.c_demands[cid] = self._next_requirement_mask()
+                self.c_start[cid] = self.env.now
+                self.c_initial_pass[cid] = True
+                self.log_event(
+                    "REQUEUE",
+                    self._label(cid),
+                    "",
+                    f"New req: {self._demands_list(cid)}",
+                )
+                self._enter_waiting(cid)
+        else:
+            self._record_total_time(time_in_system)
+            self.completed_customers += 1
+            self.log_event(
+                "DEPARTED",
+                self._label(cid),
+                "",
+                f"Total time: {time_in_system:.2f} min",
+            )
+
+    # --- main loop ------------------------------------------------------
+
+    def run_simulation(
+        self,
+        until_time,
+        mean_arrival_time,
+        requeue_prob,
+        arrival_rate,
+        station_configs,
+        max_time_for_requeue,
+        collect_stats=True,
+    ):
+        self.rng = RNG
+        self._mean_arrival_time = mean_arrival_time
+        self._pregenerate(until_time, mean_arrival_time)
+        self.setup_stations(station_configs, collect_stats)
+        self.max_time_for_requeue = max_time_for_requeue
+        self.requeue_prob = requeue_prob
+
+        # Seed the event heap: first arrival + per-minute snapshots
+        self.schedule(self._next_arrival_time(), EV_ARRIVAL)
+        for minute in range(1, int(until_time) + 1):
+            self.schedule(float(minute), EV_SNAPSHOT)
+
+        print(f"=== Running Simulation for {until_time} minutes ===")
+        print(f"λ = {arrival_rate} customers/min")
+        print(f"Arrival interval = 1 / λ = {mean_arrival_time:.2f} minutes")
+        print(f"Re-queue probability: {requeue_prob * 100:.1f}%")
+        if max_time_for_requeue > 0:
+            print(
+                f"Max time for requeue eligibility: {max_time_for_requeue:.2f} minutes\n"
+            )
+        else:
+            print(f"Max time for requeue eligibility: Unlimited\n")
+
+        start_real_time = time.time()
+
+        while self.heap_n:
+            t, kind, payload = self._pop_event()
+            if t >= until_time:
+                break
+            self.env.now = t
+            if kind == EV_SERVICE_END:
+                self._handle_service_end(*payload)
+            elif kind == EV_ARRIVAL:
+                self._handle_arrival(payload)
+            else:  # EV_SNAPSHOT
+                self.capture_station_snapshot()
+        self.env.now = until_time
+
+        end_real_time = time.time()
+
+        print(
+            f"Simulation completed in {end_real_time - start_real_time:.2f} seconds\n"
+        )
+
+        self.print_results()
+        self.print_event_log()
+        self.print_station_timeline()
+
+
+# -------------------------------------------
+#          QDC ENGINE (VECTORIZED)
+# -------------------------------------------
+
+
+@njit(cache=True)
+def _qdc_pass(arrivals, services, free):
+    """Departure computation for one M/M/c station.
+
+    Walks customers in arrival (FIFO) order keeping `free`, a c-slot
+    min-heap of server-free times: start[i] = max(arrivals[i], heap_min),
+    then the finished server slot is heap-replaced with the departure time.
+    The heap is caller-owned so station state carries across requeue
+    generations.  Returns (departures, waits); one tight loop over NumPy
+    arrays instead of one scheduled event per customer."""
+    n = arrivals.shape[0]
+    c = free.shape[0]
+    departures = np.empty(n)
+    waits = np.empty(n)
+    if c <= 32:
+        # For small server counts a branch-free linear argmin beats the
+        # heap's sift-down; every station config here lands on this path
+        for i in range(n):
+            min_idx = 0
+            min_free = free[0]
+            for j in range(1, c):
+                if free[j] < min_free:
+                    min_free = free[j]
+                    min_idx = j
+            arrival = arrivals[i]
+            start = arrival if arrival > min_free else min_free
+            waits[i] = start - arrival
+            departure = start + services[i]
+            departures[i] = departure
+            free[min_idx] = departure
+    else:
+        for i in range(n):
+            arrival = arrivals[i]
+            start = arrival if arrival > free[0] else free[0]
+            waits[i] = start - arrival
+            departure = start + services[i]
+            departures[i] = departure
+            # heapreplace(free, departure): sift the new value down from
+            # the root
+            pos = 0
+            while True:
+                child = 2 * pos + 1
+                if child >= c:
+                    break
+                if child + 1 < c and free[child + 1] < free[child]:
+                    child += 1
+                if free[child] >= departure:
+                    break
+                free[pos] = free[child]
+                pos = child
+            free[pos] = departure
+    return departures, waits
+
+
+@njit(cache=True)
+def _qdc_food(current, masks, bit, services, free):
+    """One food counter inside the fused cascade: pick the customers whose
+    demand mask selects this station, serve them in sorted arrival order
+    and scatter the departures back into `current` in place.  Returns
+    (wait_sum, wait_max, served, last_departure)."""
+    idx = np.where(((masks >> bit) & 1) == 1)[0]
+    m = idx.shape[0]
+    if m == 0:
+        return 0.0, 0.0, 0, 0.0
+    subset = current[idx]
+    order = np.argsort(subset, kind="mergesort")
+    departures, waits = _qdc_pass(subset[order], services, free)
+    for k in range(m):
+        current[idx[order[k]]] = departures[k]
+    return waits.sum(), waits.max(), m, departures.max()
+
+
+@njit(cache=True)
+def _qdc_generation(
+    arrivals,
+    masks,
+    svc_wait,
+    svc_app,
+    svc_main,
+    svc_des,
+    svc_dine,
+    free_wait,
+    free_app,
+    free_main,
+    free_des,
+    free_dine,
+):
+    """Fused waiting -> food counters -> dining cascade for one requeue
+    generation: a single JIT call instead of five Python-level station
+    passes with boolean-mask temporaries in between.  Service times are
+    pre-drawn by the caller (keeping all randomness on the shared
+    Generator); per-station stats come back as arrays indexed by the
+    station constants.  Returns (finish, wait_sum, wait_max, served,
+    busy, end)."""
+    n = arrivals.shape[0]
+    wait_sum = np.zeros(5)
+    wait_max = np.zeros(5)
+    served = np.zeros(5, dtype=np.int64)
+    busy = np.zeros(5)
+    end = np.zeros(5)
+
+    # Waiting: every customer passes through, already in FIFO order
+    current, waits = _qdc_pass(arrivals, svc_wait, free_wait)
+    wait_sum[WAIT] = waits.sum()
+    wait_max[WAIT] = waits.max()
+    served[WAIT] = n
+    busy[WAIT] = svc_wait.sum()
+    end[WAIT] = current.max()
+
+    w_sum, w_max, m, last = _qdc_food(current, masks, 0, svc_app, free_app)
+    wait_sum[APP] = w_sum
+    wait_max[APP] = w_max
+    served[APP] = m
+    busy[APP] = svc_app.sum()
+    end[APP] = last
+
+    w_sum, w_max, m, last = _qdc_food(current, masks, 1, svc_main, free_main)
+    wait_sum[MAIN] = w_sum
+    wait_max[MAIN] = w_max
+    served[MAIN] = m
+    busy[MAIN] = svc_main.sum()
+    end[MAIN] = last
+
+    w_sum, w_max, m, last = _qdc_food(current, masks, 2, svc_des, free_des)
+    wait_sum[DESS] = w_sum
+    wait_max[DESS] = w_max
+    served[DESS] = m
+    busy[DESS] = svc_des.sum()
+    end[DESS] = last
+
+    # Dining: everyone again, sorted by food-counter departure
+    order = np.argsort(current, kind="mergesort")
+    departures, waits = _qdc_pass(current[order], svc_dine, free_dine)
+    finish = np.empty(n)
+    for k in range(n):
+        finish[order[k]] = departures[k]
+    wait_sum[DINE] = waits.sum()
+    wait_max[DINE] = waits.max()
+    served[DINE] = n
+    busy[DINE] = svc_dine.sum()
+    end[DINE] = departures.max()
+
+    return finish, wait_sum, wait_max, served, busy, end
+
+
+class QDCBuffetSimulation:
+    """Closed-form QDC (queue departure computation) engine.
+
+    Instead of dispatching discrete events, each station's departures are
+    computed directly from its arrival and service-time arrays with
+    _qdc_pass, cascading waiting -> appetizer -> main_course -> dessert ->
+    dining and feeding requeued customers back as a new sorted generation
+    of arrivals.  Every customer is one vector element per station rather
+    than several scheduler resumes, so this is by far the fastest engine —
+    but queue capacities, balking and reneging are NOT modeled, so it only
+    matches the DES engines where queues are uncongested.  Use it for quick
+    parameter sweeps and the DES engines for validated runs."""
+
+    def run_simulation(
+        self,
+        until_time,
+        mean_arrival_time,
+        requeue_prob,
+        arrival_rate,
+        station_configs,
+        max_time_for_requeue,
+        collect_stats=True,
+    ):
+        # collect_stats is accepted for interface parity with the DES
+        # engines; QDC's statistics are its only output, so it is ignored
+        rng = RNG
+        configs = {config["name"]: config for config in station_configs}
+
+        print(f"=== Running QDC computation for {until_time} minutes ===")
+        print(f"λ = {arrival_rate} customers/min")
+        print(f"Arrival interval = 1 / λ = {mean_arrival_time:.2f} minutes")
+        print(f"Re-queue probability: {requeue_prob * 100:.1f}%")
+        if max_time_for_requeue > 0:
+            print(
+                f"Max time for requeue eligibility: {max_time_for_requeue:.2f} minutes"
+            )
+        else:
+            print(f"Max time for requeue eligibility: Unlimited")
+        print("Note: queue capacities, balking and reneging are not modeled\n")
+
+        start_real_time = time.time()
+
+        # Poisson arrival schedule over the horizon, in one cumsum
+        n_est = max(64, int(1.5 * until_time / mean_arrival_time))
+        arrivals = np.cumsum(rng.exponential(mean_arrival_time, n_est))
+        while arrivals[-1] < until_time:
+            extra = np.cumsum(rng.exponential(mean_arrival_time, n_est))
+            arrivals = np.concatenate([arrivals, arrivals[-1] + extra])
+        arrivals = arrivals[arrivals < until_time]
+        total_arrived = len(arrivals)
+
+        station_order = ["waiting", "appetizer", "main_course", "dessert", "dining"]
+        wait_sum = {name: 0.0 for name in station_order}
+        wait_max = {name: 0.0 for name in station_order}
+        served = {name: 0 for name in station_order}
+        busy_time = {name: 0.0 for name in station_order}
+        # QDC drains every customer even past the horizon, so utilization
+        # is normalized by each station's actual busy span, not until_time
+        end_time = {name: until_time for name in station_order}
+        # One persistent server-free-time heap per station: requeue
+        # generations share servers instead of double-booking them
+        server_free = {
+            name: np.zeros(configs[name]["num_servers"]) for name in station_order
+        }
+
+        completed = 0
+        requeue_events = 0
+        denied_requeue = 0
+        total_time_sum = 0.0
+        max_total_time = 0.0
+
+        # Each loop pass is one "generation": external arrivals first, then
+        # the requeued customers of the previous generation, and so on
+        current_arrivals = arrivals
+        masks = rng.integers(1, 8, len(arrivals), dtype=np.uint8)
+        while len(current_arrivals) > 0:
+            n = len(current_arrivals)
+            entered = current_arrivals
+
+            # Pre-draw every service time for this generation in the same
+            # order the unfused loop drew them (waiting, then each food
+            # counter's visiting subset, then dining) so results match
+            generation_services = [
+                rng.exponential(configs["waiting"]["mean_service_time"], n)
+            ]
+            for bit, name in enumerate(("appetizer", "main_course", "dessert")):
+                m = int((((masks >> bit) & 1) == 1).sum())
+                generation_services.append(
+                    rng.exponential(configs[name]["mean_service_time"], m)
+                )
+            generation_services.append(
+                rng.exponential(configs["dining"]["mean_service_time"], n)
+            )
+
+            # One fused JIT call runs the whole five-station cascade
+            finish, g_wait_sum, g_wait_max, g_served, g_busy, g_end = (
+                _qdc_generation(
+                    entered,
+                    masks,
+                    *generation_services,
+                    *(server_free[name] for name in station_order),
+                )
+            )
+            for idx, name in enumerate(station_order):
+                if not g_served[idx]:
+                    continue
+                wait_sum[name] += float(g_wait_sum[idx])
+                wait_max[name] = max(wait_max[name], float(g_wait_max[idx]))
+                served[name] += int(g_served[idx])
+                busy_time[name] += float(g_busy[idx])
+                end_time[name] = max(end_time[name], float(g_end[idx]))
+
+            # Requeue decision, vectorized: draw once per customer and
+            # apply the same max-time rule as the DES engines
+            time_in_system = finish - entered
+            wants_more = rng.random(n) < requeue_prob
+            if max_time_for_requeue > 0:
+                within_limit = time_in_system <= max_time_for_requeue
+            else:
+                within_limit = np.ones(n, dtype=bool)
+            # Requeues landing after the horizon would never be processed
+            requeue = wants_more & within_limit & (finish < until_time)
+            leaving = ~requeue
+
+            denied_requeue += int((wants_more & ~within_limit).sum())
+            completed += int(leaving.sum())
+            total_time_sum += float(time_in_system[leaving].sum())
+            if leaving.any():
+                max_total_time = max(
+                    max_total_time, float(time_in_system[leaving].max())
+                )
+            requeue_events += int(requeue.sum())
+
+            current_arrivals = np.sort(finish[requeue], kind="stable")
+            masks = rng.integers(1, 8, len(current_arrivals), dtype=np.uint8)
+
+        end_real_time = time.time()
+        print(
+            f"Computation completed in {end_real_time - start_real_time:.2f} seconds\n"
+        )
+
+        print("=" * 70)
+        print("QDC RESULTS (uncapacitated approximation)")
+        print("=" * 70)
+        print(f"\n--- Overall Statistics ---")
+        print(f"Total customers arrived: {total_arrived}")
+        print(f"Customers completed: {completed}")
+        print(f"Re-queue events (after dining): {requeue_events}")
+        print(f"Left because denied requeue (exceeded max time): {denied_requeue}")
+        if completed:
+            print(f"\nAverage time in system: {total_time_sum / completed:.2f} minutes")
+            print(f"Max time in system: {max_total_time:.2f} minutes")
+
+        print("\n" + "=" * 70)
+        print("STATION-BY-STATION METRICS")
+        print("=" * 70)
+        for name in station_order:
+            config = configs[name]
+            print(f"\n--- {name} ---")
+            print(f"Servers: {config['num_servers']}")
+            print(f"Customers served: {served[name]}")
+            if served[name]:
+                print(f"Average wait time: {wait_sum[name] / served[name]:.2f} minutes")
+            print(f"Max wait time: {wait_max[name]:.2f} minutes")
+            utilization = (
+                busy_time[name] / (end_time[name] * config["num_servers"])
+            ) * 100
+            print(f"Server utilization: {utilization:.2f}%")
 
 
 # -------------------------------------------
@@ -597,44 +1872,187 @@ MAX_TIME_REQUEUE_WORKLOAD1 = 0  # unlimited
 MAX_TIME_REQUEUE_WORKLOAD2 = 45.0  # 45 minutes
 
 # -------------------------------------------
-#          MAIN EXECUTION
+#          ANALYTICAL M/M/c FORMULAS
 # -------------------------------------------
 
-if __name__ == "__main__":
-    random.seed(42)
 
+def analytical_mmc(lam, mu, c):
+    """Closed-form steady-state metrics for a stable M/M/c queue.
+
+    Returns a dict with rho, P0, Lq, Wq, W and L (Erlang-C formulas);
+    returns None when the queue is unstable (rho >= 1).  Uses lgamma so
+    the a**c / c! terms stay finite for large server counts.
+    """
+    a = lam / mu  # offered load
+    rho = a / c
+    if rho >= 1:
+        return None
+    # P0 = 1 / (sum_{k<c} a^k/k! + (a^c/c!) / (1-rho))
+    log_a = math.log(a) if a > 0 else float("-inf")
+    terms = [math.exp(k * log_a - math.lgamma(k + 1)) for k in range(c)]
+    tail = math.exp(c * log_a - math.lgamma(c + 1)) / (1 - rho)
+    p0 = 1.0 / (sum(terms) + tail)
+    erlang_c = tail * p0  # probability an arrival must wait
+    lq = erlang_c * rho / (1 - rho)
+    wq = lq / lam
+    w = wq + 1 / mu
+    return {"rho": rho, "P0": p0, "Lq": lq, "Wq": wq, "W": w, "L": lam * w}
+
+
+def print_analytical_predictions(arrival_rate, requeue_prob, station_configs):
+    """Print closed-form M/M/c predictions per station for one workload.
+
+    Effective arrival rates account for the feedback loop (each customer
+    makes 1/(1-delta) passes on average) and for food stations also the
+    4/7 chance a uniform non-zero requirement mask selects the station.
+    Queue-capacity truncation (balking/reneging) is not modeled, so these
+    are upper bounds for the congested cases — use the simulation there.
+    """
+    passes = 1.0 / (1.0 - requeue_prob)
     print("\n" + "=" * 70)
-    print("BUFFET QUEUEING SIMULATION")
+    print(f"ANALYTICAL M/M/c PREDICTIONS (λ = {arrival_rate}, δ = {requeue_prob})")
     print("=" * 70)
+    for config in station_configs:
+        name = config["name"]
+        c = config["num_servers"]
+        mu = 1.0 / config["mean_service_time"]
+        lam_eff = arrival_rate * passes
+        if name in ("appetizer", "main_course", "dessert"):
+            lam_eff *= 4.0 / 7.0
+        print(f"\n--- {name} ---")
+        print(f"Effective λ: {lam_eff:.3f} customers/min, µ = {mu:.3f}, c = {c}")
+        result = analytical_mmc(lam_eff, mu, c)
+        if result is None:
+            print("Unstable (ρ >= 1): queue grows without bound, simulate instead")
+            continue
+        print(f"Server utilization ρ: {result['rho'] * 100:.2f}%")
+        print(f"Average queue length L_q: {result['Lq']:.3f}")
+        print(f"Average wait in queue W_q: {result['Wq']:.3f} minutes")
+        print(f"Average time in station W: {result['W']:.3f} minutes")
 
-    # Run full simulation with hardcoded values
-    print("\n" + "#" * 70)
-    print("# WORKLOAD 1 with λ =", WORKLOAD1_ARRIVAL_RATE)
-    print("#" * 70)
-
-    sim1 = BuffetSimulation()
-    sim1.run_simulation(
-        until_time=SIM_TIME,
-        mean_arrival_time=1 / WORKLOAD1_ARRIVAL_RATE,
-        requeue_prob=REQUEUE_PROB_WORKLOAD1,
-        arrival_rate=WORKLOAD1_ARRIVAL_RATE,
-        station_configs=STATION_CONFIGS,
-        max_time_for_requeue=MAX_TIME_REQUEUE_WORKLOAD1,
-    )
 
-    # --- WORKLOAD 2 ---
-    print("\n" + "#" * 70)
-    print("# WORKLOAD 2 with λ =", WORKLOAD2_ARRIVAL_RATE)
-    print("#" * 70)
-
-    sim2 = BuffetSimulation()
-    sim2.run_simulation(
-        until_time=SIM_TIME,
-        mean_arrival_time=1 / WORKLOAD2_ARRIVAL_RATE,
-        requeue_prob=REQUEUE_PROB_WORKLOAD2,
-        arrival_rate=WORKLOAD2_ARRIVAL_RATE,
-        station_configs=STATION_CONFIGS,
-        max_time_for_requeue=MAX_TIME_REQUEUE_WORKLOAD2,
+# -------------------------------------------
+#          WORKLOAD RUNNERS
+# -------------------------------------------
+
+
+def run_workload(params):
+    """Run one workload described by a plain dict and return its full text
+    report.  Top-level and picklable so independent workloads (or parameter
+    sweeps) can be dispatched to worker processes."""
+    global RNG
+    RNG = np.random.default_rng(params.get("seed", RANDOM_SEED))
+
+    simulation_class = {
+        "fast": FastBuffetSimulation,
+        "qdc": QDCBuffetSimulation,
+    }.get(params.get("engine"), BuffetSimulation)
+    arrival_rate = params["arrival_rate"]
+
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer):
+        print("\n" + "#" * 70)
+        print(f"# {params.get('label', 'WORKLOAD')} with λ =", arrival_rate)
+        print("#" * 70)
+        sim = simulation_class()
+        sim.run_simulation(
+            until_time=params.get("sim_time", SIM_TIME),
+            mean_arrival_time=1 / arrival_rate,
+            requeue_prob=params["requeue_prob"],
+            arrival_rate=arrival_rate,
+            station_configs=params.get("station_configs", STATION_CONFIGS),
+            max_time_for_requeue=params.get("max_time_for_requeue", 0),
+            collect_stats=params.get("collect_stats", True),
+        )
+    return buffer.getvalue()
+
+
+def run_batch(config_path, engine, collect_stats=True):
+    """Dispatch every workload in a JSON config file to its own process.
+
+    The file holds a list of run_workload() parameter dicts; each worker
+    gets its own RNG seed so replicates are independent."""
+    with open(config_path) as config_file:
+        configs = json.load(config_file)
+    for i, params in enumerate(configs):
+        params.setdefault("seed", RANDOM_SEED + i)
+        params.setdefault("engine", engine)
+        params.setdefault("collect_stats", collect_stats)
+        params.setdefault("label", f"BATCH RUN {i + 1}")
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        for report in executor.map(run_workload, configs):
+            print(report)
+
+
+# -------------------------------------------
+#          MAIN EXECUTION
+# -------------------------------------------
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Buffet queueing simulation")
+    parser.add_argument(
+        "--engine",
+        choices=["simpy", "fast", "qdc"],
+        default="simpy",
+        help="simulation engine: 'simpy' (reference), 'fast' (heapq event "
+        "loop) or 'qdc' (vectorized closed-form, no capacity limits)",
+    )
+    parser.add_argument(
+        "--batch",
+        metavar="CONFIG.json",
+        help="run every workload in a JSON config file, one process each",
     )
+    parser.add_argument(
+        "--analytical",
+        action="store_true",
+        help="print closed-form M/M/c predictions instead of simulating",
+    )
+    parser.add_argument(
+        "--no-stats",
+        action="store_true",
+        help="skip per-station statistics collection (timing/calibration runs)",
+    )
+    args = parser.parse_args()
+
+    print("\n" + "=" * 70)
+    print("BUFFET QUEUEING SIMULATION")
+    print("=" * 70)
 
-    print("\nSimulation completed for all workloads!\n")
+    if args.analytical:
+        print_analytical_predictions(
+            WORKLOAD1_ARRIVAL_RATE, REQUEUE_PROB_WORKLOAD1, STATION_CONFIGS
+        )
+        print_analytical_predictions(
+            WORKLOAD2_ARRIVAL_RATE, REQUEUE_PROB_WORKLOAD2, STATION_CONFIGS
+        )
+    elif args.batch:
+        run_batch(args.batch, args.engine, not args.no_stats)
+    else:
+        # Run full simulation with hardcoded values.  The two workloads
+        # are independent runs with their own RNG seeding, so each gets
+        # its own worker process (same machinery as --batch) and the
+        # reports print in order as they complete.
+        workloads = [
+            {
+                "label": "WORKLOAD 1",
+                "arrival_rate": WORKLOAD1_ARRIVAL_RATE,
+                "requeue_prob": REQUEUE_PROB_WORKLOAD1,
+                "max_time_for_requeue": MAX_TIME_REQUEUE_WORKLOAD1,
+                "engine": args.engine,
+                "collect_stats": not args.no_stats,
+            },
+            {
+                "label": "WORKLOAD 2",
+                "arrival_rate": WORKLOAD2_ARRIVAL_RATE,
+                "requeue_prob": REQUEUE_PROB_WORKLOAD2,
+                "max_time_for_requeue": MAX_TIME_REQUEUE_WORKLOAD2,
+                "engine": args.engine,
+                "collect_stats": not args.no_stats,
+            },
+        ]
+        with ProcessPoolExecutor(max_workers=len(workloads)) as executor:
+            for report in executor.map(run_workload, workloads):
+                print(report)
+
+    if not args.analytical:
+        print("\nSimulation completed for all workloads!\n")